@@ -2,107 +2,254 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+import dataclasses
+import re
 import warnings
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-def setup_environment():
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # optional: faster CSV parsing and string kernels
+    pa = None
+
+try:
+    import numexpr as ne
+except ImportError:  # optional: fused salary validation
+    ne = None
+
+# Keep pre-cleaning copies of transformed columns (e.g. "HourlyRate_orig")
+DEBUG = False
+
+# Print the per-stage diagnostics (profiles, summaries, sample rows)
+VERBOSE = False
+
+# Currency symbols and thousands separators stripped from money columns
+_CURRENCY_RE = re.compile(r'[\$,]')
+
+# Category labels that suggest an ordinal scale
+ORDINAL_KEYWORDS = frozenset({"general", "medium", "high", "junior", "senior", "entry", "mid"})
+
+# Below this many rows, importing numba and JIT-compiling the kernel costs more
+# than DataFrame.clip takes, so the vectorized path is used instead
+NUMBA_MIN_ROWS = 5_000_000
+
+@lru_cache(maxsize=None)
+def _clip_iqr_kernel():
+    """Return the compiled outlier-capping kernel, or None without numba."""
+    try:
+        from numba import njit, prange
+    except ImportError:  # optional: compiled outlier capping
+        return None
+
+    # No cache=True: the script is loaded via importlib (its filename has spaces),
+    # and numba's on-disk cache then points at an unimportable '<dynamic>' module
+    @njit(parallel=True)
+    def clip_iqr(values, lower, upper):
+        """Cap each column of a 2-D float array at its bounds, in place."""
+        n, k = values.shape
+        for i in prange(n):
+            for j in range(k):
+                x = values[i, j]
+                if x < lower[j]:
+                    values[i, j] = lower[j]
+                elif x > upper[j]:
+                    values[i, j] = upper[j]
+    return clip_iqr
+
+@dataclasses.dataclass(frozen=True)
+class ColumnIndex:
+    """Numeric and categorical column names shared by the pipeline stages.
+
+    A stage that turns a column from one kind into the other returns a new
+    index alongside the frame instead of modifying this one.
+    """
+    num: list
+    cat: list
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls(
+            num=df.select_dtypes(include=[np.number]).columns.tolist(),
+            cat=df.select_dtypes(include=['object', 'string']).columns.tolist(),
+        )
+
+def _resolve_verbose(verbose):
+    """Read VERBOSE at call time when no explicit verbose flag is given."""
+    return VERBOSE if verbose is None else verbose
+
+def setup_environment(verbose=None):
     """Set up the environment and print library versions."""
+    verbose = _resolve_verbose(verbose)
     warnings.filterwarnings('ignore')
-    print("pandas:", pd.__version__)
-    print("numpy:", np.__version__)
-    print("seaborn:", sns.__version__)
+    if verbose:
+        print("pandas:", pd.__version__)
+        print("numpy:", np.__version__)
+        print("seaborn:", sns.__version__)
 
 def load_data(data_path):
     """Load the dataset from CSV file."""
-    df = pd.read_csv(data_path)
+    # The Arrow parser is multithreaded and Arrow-backed columns keep strings in
+    # contiguous buffers; fall back to the C parser and numpy dtypes without pyarrow
+    if pa is not None:
+        df = pd.read_csv(data_path, engine='pyarrow', dtype_backend='pyarrow')
+        # Entirely blank columns come back as null[pyarrow], which can't be filled;
+        # treat them as text so the "Unknown" fallback in imputation applies
+        null_cols = [c for c in df.columns if df[c].dtype == pd.ArrowDtype(pa.null())]
+        if null_cols:
+            df[null_cols] = df[null_cols].astype(pd.ArrowDtype(pa.string()))
+        # Integer columns with gaps load as int64[pyarrow] rather than float64, and
+        # median imputation would truncate a fractional median; widen them as numpy does
+        gappy_int_cols = [
+            c for c in df.columns
+            if isinstance(df[c].dtype, pd.ArrowDtype)
+            and pa.types.is_integer(df[c].dtype.pyarrow_dtype)
+            and df[c].hasnans
+        ]
+        if gappy_int_cols:
+            df[gappy_int_cols] = df[gappy_int_cols].astype(pd.ArrowDtype(pa.float64()))
+    else:
+        df = pd.read_csv(data_path)
     return df
 
-def profile_variables(df):
-    """Profile each variable in the dataset."""
-    profile = []
-    for col in df.columns:
-        s = df[col]
-        # determine quantitative vs qualitative
-        if pd.api.types.is_numeric_dtype(s):
-            var_type = "Quantitative/Numerical"
-            subtype = "Continuous" if s.nunique() > 20 else "Discrete"
+def _profile_column(s, is_num, n_unique, missing):
+    """Build the profile record for a single column."""
+    # Dedupe first and drop NaN from the (small) result, not from the column
+    unique_vals = s.unique()
+    unique_vals = unique_vals[pd.notna(unique_vals)]
+    # determine quantitative vs qualitative
+    if is_num:
+        var_type = "Quantitative/Numerical"
+        subtype = "Continuous" if n_unique > 20 else "Discrete"
+    else:
+        var_type = "Qualitative/Categorical"
+        # crude ordinal inference
+        vals_lc = {x.strip().lower() for x in unique_vals if isinstance(x, str)}
+        if len(unique_vals) <= 12 and vals_lc & ORDINAL_KEYWORDS:
+            subtype = "Ordinal (inferred)"
         else:
-            var_type = "Qualitative/Categorical"
-            unique_vals = s.dropna().unique()
-            # crude ordinal inference
-            ordinal_keywords = {"general","medium","high","junior","senior","entry","mid","senior"}
-            if len(unique_vals) <= 12 and any(isinstance(x, str) and x.strip().lower() in ordinal_keywords for x in unique_vals):
-                subtype = "Ordinal (inferred)"
-            else:
-                subtype = "Nominal"
-        sample_values = s.dropna().astype(str).unique()[:8].tolist()
-        missing = int(s.isna().sum())
-        profile.append({
-            "variable": col,
-            "data_type": var_type,
-            "subtype": subtype,
-            "n_unique": int(s.nunique(dropna=True)),
-            "missing": missing,
-            "sample_values": sample_values
-        })
+            subtype = "Nominal"
+    # only stringify the handful of samples, not the whole column
+    sample_values = [str(v) for v in unique_vals[:8]]
+    return {
+        "variable": s.name,
+        "data_type": var_type,
+        "subtype": subtype,
+        "n_unique": int(n_unique),
+        "missing": int(missing),
+        "sample_values": sample_values
+    }
+
+def profile_variables(df, verbose=None):
+    """Profile each variable in the dataset."""
+    verbose = _resolve_verbose(verbose)
+    # Column-level statistics in one vectorized pass each
+    n_unique = df.nunique(dropna=True)
+    missing = df.isna().sum()
+    is_num = df.dtypes.map(pd.api.types.is_numeric_dtype)
+    
+    # Columns are independent and pandas releases the GIL in its C reductions,
+    # so threads (no pickling) are enough to profile them concurrently
+    with ThreadPoolExecutor() as executor:
+        profile = list(executor.map(
+            lambda col: _profile_column(df[col], is_num[col], n_unique[col], missing[col]),
+            df.columns
+        ))
     
     profile_df = pd.DataFrame(profile)
-    print(profile_df.to_string(index=False))
+    if verbose:
+        print(profile_df.to_string(index=False))
     return profile_df
 
-def inspect_data(df):
+def inspect_data(df, columns, verbose=None):
     """Inspect the data and display basic information."""
-    rows, columns = df.shape
-    print(f"The dataset has {rows} rows and {columns} columns")
-    print("Columns:", df.columns, "\n")
-    print("Descriptive statistics:")
-    descriptive_stats = df.describe(include='all').transpose()
-    print(descriptive_stats)
+    verbose = _resolve_verbose(verbose)
+    if verbose:
+        rows, n_columns = df.shape
+        print(f"The dataset has {rows} rows and {n_columns} columns")
+        print("Columns:", df.columns, "\n")
+        print("Descriptive statistics:")
+    # Only the statistics we report: no percentiles, and top/freq for categoricals only
+    parts = []
+    if columns.num:
+        parts.append(df[columns.num].agg(['count', 'mean', 'std', 'min', 'max']))
+    if columns.cat:
+        parts.append(df[columns.cat].describe())
+    stats = pd.concat(parts, axis=1).transpose() if parts else pd.DataFrame()
+    descriptive_stats = stats.reindex(df.columns)
+    if verbose:
+        print(descriptive_stats)
     return descriptive_stats
 
-def handle_duplicates(df):
+def handle_duplicates(df, verbose=None):
     """Remove duplicate entries from the dataset."""
+    verbose = _resolve_verbose(verbose)
     dup_mask = df.duplicated()
-    dup_count = dup_mask.sum()
-    print("Exact duplicate rows:", dup_count)
-    if dup_count:
-        print("First few duplicate rows:")
-        print(df[dup_mask].head())
-    
-    print("Original shape:", df.shape)
-    df_clean = df.drop_duplicates().reset_index(drop=True)
-    print("New shape after dropping duplicates:", df_clean.shape)
+    if verbose:
+        dup_count = dup_mask.sum()
+        print("Exact duplicate rows:", dup_count)
+        if dup_count:
+            print("First few duplicate rows:")
+            print(df[dup_mask].head())
+        print("Original shape:", df.shape)
+    
+    # Reuse the mask rather than letting drop_duplicates() re-hash every row, and
+    # renumber in place instead of copying the frame again via reset_index().
+    # take() (unlike boolean __getitem__) yields a frame that isn't flagged as a
+    # copy of df, so later column assignments don't raise SettingWithCopyWarning
+    df_clean = df.take(np.flatnonzero(~dup_mask.to_numpy()))
+    df_clean.index = pd.RangeIndex(len(df_clean))
+    if verbose:
+        print("New shape after dropping duplicates:", df_clean.shape)
     return df_clean
 
-def handle_missing_values(df_clean):
+def handle_missing_values(df_clean, columns, verbose=None):
     """Handle missing values in the dataset."""
-    missing_counts = df_clean.isnull().sum().sort_values(ascending=False)
-    print("Missing values per column: ", missing_counts)
+    verbose = _resolve_verbose(verbose)
+    missing_counts = df_clean.isnull().sum()
+    if verbose:
+        print("Missing values per column: ", missing_counts.sort_values(ascending=False))
+    
+    # Only columns that actually have gaps need a median/mode computed
+    cols_with_na = set(missing_counts.index[missing_counts > 0])
     
     # Numeric median imputation
-    num_cols = df_clean.select_dtypes(include=[np.number]).columns
-    for col in num_cols:
-        median_val = df_clean[col].median()
-        df_clean[col] = df_clean[col].fillna(median_val)
+    num_cols = [c for c in columns.num if c in cols_with_na]
+    med = df_clean[num_cols].median()
+    df_clean.fillna(med, inplace=True)
     
-    # Categorical mode imputation
-    cat_cols = df_clean.select_dtypes(include=['object']).columns
-    for col in cat_cols:
-        if df_clean[col].mode().size > 0:
-            mode_val = df_clean[col].mode().iloc[0]
-            df_clean[col] = df_clean[col].fillna(mode_val)
-        else:
-            df_clean[col] = df_clean[col].fillna("Unknown")
+    # Categorical mode imputation (all-missing columns fall back to "Unknown")
+    cat_cols = [c for c in columns.cat if c in cols_with_na]
+    # value_counts(sort=False).idxmax() finds the top value in one linear scan,
+    # where mode() sorts every unique value
+    modes = pd.Series({
+        col: df_clean[col].value_counts(sort=False).idxmax() if missing_counts[col] < len(df_clean) else "Unknown"
+        for col in cat_cols
+    }, dtype=object)
+    df_clean.fillna(modes, inplace=True)
     
-    final_missing_counts = df_clean.isnull().sum().sort_values(ascending=False)
-    print("Missing values after imputation: ", final_missing_counts)
-    return df_clean, cat_cols
+    if verbose:
+        # Derive the remaining gaps from the snapshot instead of rescanning the frame:
+        # only numeric columns without a median (all missing) are left unfilled
+        final_missing_counts = missing_counts.copy()
+        final_missing_counts[med.index[med.notna()]] = 0
+        final_missing_counts[cat_cols] = 0
+        print("Missing values after imputation: ", final_missing_counts.sort_values(ascending=False))
+    return df_clean
 
-def handle_inconsistent_entries(df_clean, cat_cols):
+def handle_inconsistent_entries(df_clean, columns, verbose=None):
     """Handle inconsistent entries in categorical columns."""
-    for col in cat_cols:
-        unique_vals = df_clean[col].dropna().astype(str).unique()
-        print(f"\nColumn: {col} - Unique Values Count: {len(unique_vals)}")
-        print(col, "->", unique_vals[:])
+    verbose = _resolve_verbose(verbose)
+    cat_cols = columns.cat
+    if verbose:
+        for col in cat_cols:
+            unique_vals = df_clean[col].unique()
+            unique_vals = unique_vals[pd.notna(unique_vals)]
+            print(f"\nColumn: {col} - Unique Values Count: {len(unique_vals)}")
+            # Listing thousands of values only builds a huge repr; show the first 20
+            more = f" ... (+{len(unique_vals) - 20} more)" if len(unique_vals) > 20 else ""
+            print(f"{col} -> {list(unique_vals[:20])}{more}")
     
     # Create Mapping dictionary for inconsistent entries
     mapping = {
@@ -115,109 +262,158 @@ def handle_inconsistent_entries(df_clean, cat_cols):
         'Direct Deposit': 'Direct Deposit',
     }
     
-    if 'PaycheckMethod' in df_clean.columns:
-        df_clean['PaycheckMethod'] = df_clean['PaycheckMethod'].replace(mapping)
-    
-    # Generic normalization
-    df_clean[cat_cols] = df_clean[cat_cols].apply(lambda col: col.str.title())
+    # Remapping and generic normalization both act on the categories, so they
+    # cost O(unique values) rather than O(rows)
+    for col in cat_cols:
+        df_clean[col] = df_clean[col].astype('category')
+        categories = df_clean[col].cat.categories
+        normalized = categories
+        if col == 'PaycheckMethod':
+            normalized = normalized.map(lambda c: mapping.get(c, c))
+        # Non-string categories (e.g. numbers in an object column) are left as-is
+        normalized = normalized.map(lambda c: c.strip().title() if isinstance(c, str) else c)
+        if normalized.is_unique:
+            df_clean[col] = df_clean[col].cat.rename_categories(normalized)
+        else:
+            # e.g. 'Mail Check' and 'MailedCheck' collapse into one category
+            df_clean[col] = df_clean[col].map(dict(zip(categories, normalized))).astype('category')
     return df_clean
 
-def clean_currency_formatting(df_clean):
-    """Clean currency formatting in numeric columns."""
+def clean_currency_formatting(df_clean, columns, verbose=None):
+    """Clean currency formatting in numeric columns.
+
+    Returns the cleaned frame and a ColumnIndex with the converted columns
+    moved from categorical to numeric.
+    """
+    verbose = _resolve_verbose(verbose)
     hourly_cols = [c for c in df_clean.columns if c.strip() == 'HourlyRate']
     
     if not hourly_cols:
-        print("No HourlyRate column found.")
+        if verbose:
+            print("No HourlyRate column found.")
     else:
         for col in hourly_cols:
+            raw = df_clean[col].astype(str)
             backup_col = f"{col}_orig"
-            if backup_col not in df_clean.columns:
-                df_clean[backup_col] = df_clean[col].astype(str)
+            if DEBUG and backup_col not in df_clean.columns:
+                df_clean[backup_col] = raw
             
-            cleaned = df_clean[col].astype(str).str.replace(r'[\$,]', '', regex=True).str.strip()
+            if pa is not None:
+                # Arrow's C++ UTF-8 kernels process the whole column in one call
+                arr = pc.replace_substring_regex(pa.array(raw, type=pa.string()), _CURRENCY_RE.pattern, '')
+                cleaned = pd.Series(pc.utf8_trim_whitespace(arr).to_pandas(), index=df_clean.index)
+            else:
+                cleaned = raw.str.replace(_CURRENCY_RE, '', regex=True).str.strip()
             df_clean[col] = pd.to_numeric(cleaned.replace('', np.nan), errors='coerce')
             
             n_coerced = df_clean[col].isna().sum()
-            print(f"Column '{col}': {n_coerced} non-numeric/missing after stripping currency (of {len(df_clean)})")
+            if verbose:
+                print(f"Column '{col}': {n_coerced} non-numeric/missing after stripping currency (of {len(df_clean)})")
             
             if n_coerced:
                 med = df_clean[col].median()
                 df_clean[col] = df_clean[col].fillna(med)
-                print(f"Imputed {n_coerced} values in '{col}' with median = {med:.2f}")
+                if verbose:
+                    print(f"Imputed {n_coerced} values in '{col}' with median = {med:.2f}")
             
-            print(f"'{col}' dtype after cleaning:", df_clean[col].dtype)
-    return df_clean
+            if verbose:
+                print(f"'{col}' dtype after cleaning:", df_clean[col].dtype)
+            
+            # The column is numeric now; keep the views in frame order
+            columns = dataclasses.replace(
+                columns,
+                num=[c for c in df_clean.columns if c in columns.num or c == col],
+                cat=[c for c in columns.cat if c != col],
+            )
+    return df_clean, columns
 
-def handle_outliers(df_clean):
+def handle_outliers(df_clean, columns, verbose=None):
     """Detect and handle outliers using IQR method."""
-    numeric_cols = df_clean.select_dtypes(include=[np.number]).columns.tolist()
-    summary = []
-    
-    for col in numeric_cols:
-        s = df_clean[col].dropna()
-        q1 = s.quantile(0.25)
-        q3 = s.quantile(0.75)
-        iqr = q3 - q1
-        lower = q1 - 1.5 * iqr
-        upper = q3 + 1.5 * iqr
-        
-        out_mask = (df_clean[col] < lower) | (df_clean[col] > upper)
-        n_out = int(out_mask.sum())
-        pct_out = n_out / len(df_clean) * 100
-        
-        summary.append({
-            "variable": col,
-            "n_outliers": n_out,
-            "pct_outliers": pct_out,
+    verbose = _resolve_verbose(verbose)
+    numeric_cols = columns.num
+    # Plain float64 block: Arrow-backed columns can't be clipped 2-D, and both
+    # capping paths then return float64 like np.where did
+    numeric = df_clean[numeric_cols].astype(np.float64)
+    
+    # All quartiles in one batched call; NaNs are skipped as before
+    q = numeric.quantile([0.25, 0.75])
+    iqr = q.loc[0.75] - q.loc[0.25]
+    lower = q.loc[0.25] - 1.5 * iqr
+    upper = q.loc[0.75] + 1.5 * iqr
+    
+    # The outlier counts are only reported, so skip the comparison pass when quiet
+    if verbose:
+        n_out = ((numeric < lower) | (numeric > upper)).sum()
+        outlier_summary = pd.DataFrame({
+            "n_outliers": n_out.astype(int),
+            "pct_outliers": n_out / len(df_clean) * 100,
             "lower_bound": lower,
             "upper_bound": upper,
             "iqr": iqr
         })
+        outlier_summary.index.name = "variable"
         
-        if n_out:
-            print(f"{col}: {n_out} outliers ({pct_out:.2f}%) — LB={lower:.2f}, UB={upper:.2f}")
-        else:
-            print(f"{col}: 0 outliers")
-    
-    outlier_summary = pd.DataFrame(summary).set_index("variable")
-    print("\nOutlier Summary:")
-    print(outlier_summary)
+        for col, row in outlier_summary.iterrows():
+            if row["n_outliers"]:
+                print(f"{col}: {int(row['n_outliers'])} outliers ({row['pct_outliers']:.2f}%) — LB={row['lower_bound']:.2f}, UB={row['upper_bound']:.2f}")
+            else:
+                print(f"{col}: 0 outliers")
+        
+        print("\nOutlier Summary:")
+        print(outlier_summary)
     
     # Handle outliers by capping them at the IQR bounds
-    for col in numeric_cols:
-        lower = outlier_summary.loc[col, "lower_bound"]
-        upper = outlier_summary.loc[col, "upper_bound"]
-        df_clean[col] = np.where(df_clean[col] < lower, lower,
-                                np.where(df_clean[col] > upper, upper, df_clean[col]))
+    clip_iqr = _clip_iqr_kernel() if len(df_clean) >= NUMBA_MIN_ROWS else None
+    if clip_iqr is not None:
+        # C order keeps the row-major loop streaming and a single compiled signature
+        values = np.ascontiguousarray(numeric.to_numpy())
+        clip_iqr(values, lower.to_numpy(dtype=np.float64), upper.to_numpy(dtype=np.float64))
+        df_clean[numeric_cols] = values
+    else:
+        df_clean[numeric_cols] = numeric.clip(lower=lower, upper=upper, axis=1)
     return df_clean
 
-def validate_annual_salary(df_clean):
+def validate_annual_salary(df_clean, verbose=None):
     """Validate and recalculate annual salary if needed."""
+    verbose = _resolve_verbose(verbose)
     if all(col in df_clean.columns for col in ['Hourly Rate', 'Hours Weekly', 'Annual Salary']):
-        computed = df_clean['Hourly Rate'] * df_clean['Hours Weekly'] * 52
-        diff = (df_clean['Annual Salary'] - computed).abs()
-        mask = diff > (0.01 * computed)
-        df_clean.loc[mask, 'Annual Salary'] = computed[mask]
-        print("Recomputed Annual Salary for", mask.sum(), "records.")
+        hr = df_clean['Hourly Rate'].to_numpy(dtype=np.float64, na_value=np.nan)
+        hw = df_clean['Hours Weekly'].to_numpy(dtype=np.float64, na_value=np.nan)
+        ann = df_clean['Annual Salary'].to_numpy(dtype=np.float64, na_value=np.nan)
+        if ne is not None:
+            # One fused pass instead of a temporary per arithmetic step
+            mask = ne.evaluate("abs(ann - hr * hw * 52) > 0.01 * hr * hw * 52")
+        else:
+            computed = hr * hw * 52
+            mask = np.abs(ann - computed) > (0.01 * computed)
+        df_clean.loc[mask, 'Annual Salary'] = hr[mask] * hw[mask] * 52
+        if verbose:
+            print("Recomputed Annual Salary for", mask.sum(), "records.")
     return df_clean
 
-def final_checks_and_save(df_clean, output_path):
+def final_checks_and_save(df_clean, output_path, verbose=None):
     """Perform final checks and save the cleaned dataset."""
-    print("Final shape:", df_clean.shape, "\n")
-    print("Missing counts (final):")
-    print(df_clean.isnull().sum())
-    print("\nDtypes:")
-    print(df_clean.dtypes)
-    print("\nSample cleaned rows:")
-    print(df_clean.head(5))
-    
-    # Save cleaned file
-    df_clean.to_csv(output_path, index=False)
+    verbose = _resolve_verbose(verbose)
+    if verbose:
+        print("Final shape:", df_clean.shape, "\n")
+        print("Missing counts (final):")
+        print(df_clean.isnull().sum())
+        print("\nDtypes:")
+        print(df_clean.dtypes)
+        print("\nSample cleaned rows:")
+        print(df_clean.head(5))
+    
+    # Save cleaned file; Parquet stores categorical columns dictionary-encoded
+    if output_path.endswith('.parquet'):
+        df_clean.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+    else:
+        df_clean.to_csv(output_path, index=False)
     print(f"\nSaved cleaned dataset to {output_path}")
 
-def main():
+def main(verbose=None):
+    verbose = _resolve_verbose(verbose)
     # Setup
-    setup_environment()
+    setup_environment(verbose)
     
     # Define paths
     input_path = "Employee Turnover Dataset.csv"
@@ -226,22 +422,26 @@ def main():
     # Load data
     df = load_data(input_path)
     
-    # Profile variables
-    profile_variables(df)
+    columns = ColumnIndex.from_frame(df)
     
-    # Inspect data
-    inspect_data(df)
+    # Profiling and inspection only produce printed reports, so skip them when quiet
+    if verbose:
+        # Profile variables
+        profile_variables(df, verbose)
+        
+        # Inspect data
+        inspect_data(df, columns, verbose)
     
     # Clean data
-    df_clean = handle_duplicates(df)
-    df_clean, cat_cols = handle_missing_values(df_clean)
-    df_clean = handle_inconsistent_entries(df_clean, cat_cols)
-    df_clean = clean_currency_formatting(df_clean)
-    df_clean = handle_outliers(df_clean)
-    df_clean = validate_annual_salary(df_clean)
+    df_clean = handle_duplicates(df, verbose)
+    df_clean = handle_missing_values(df_clean, columns, verbose)
+    df_clean = handle_inconsistent_entries(df_clean, columns, verbose)
+    df_clean, columns = clean_currency_formatting(df_clean, columns, verbose)
+    df_clean = handle_outliers(df_clean, columns, verbose)
+    df_clean = validate_annual_salary(df_clean, verbose)
     
     # Final checks and save
-    final_checks_and_save(df_clean, output_path)
+    final_checks_and_save(df_clean, output_path, verbose)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file